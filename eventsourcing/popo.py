@@ -53,14 +53,11 @@ class POPOAggregateRecorder(AggregateRecorder):
     def _update_table(
         self, stored_events: List[StoredEvent], **kwargs: Any
     ) -> Optional[Sequence[int]]:
-        notification_ids = []
-        for s in stored_events:
-            self._stored_events.append(s)
-            self._stored_events_index[s.originator_id][s.originator_version] = (
-                len(self._stored_events) - 1
-            )
-            notification_ids.append(len(self._stored_events))
-        return notification_ids
+        start = len(self._stored_events)
+        self._stored_events.extend(stored_events)
+        for position, s in enumerate(stored_events, start):
+            self._stored_events_index[s.originator_id][s.originator_version] = position
+        return list(range(start + 1, len(self._stored_events) + 1))
 
     def select_events(
         self,
@@ -108,16 +105,17 @@ class POPOApplicationRecorder(ApplicationRecorder, POPOAggregateRecorder):
     ) -> List[Notification]:
         with self._database_lock:
             results = []
+            if limit < 1:
+                return results
             start = max(start, 1)  # Don't use negative indexes!
-            i = start - 1
-            while True:
-                if stop is not None and i > stop - 1:
-                    break
-                try:
-                    s = self._stored_events[i]
-                except IndexError:
-                    break
-                i += 1
+            last = len(self._stored_events)
+            if stop is not None:
+                last = min(stop, last)
+            if not topics:
+                # Notification IDs are positions, so limit the range upfront.
+                last = min(start + limit - 1, last)
+            for i in range(start, last + 1):
+                s = self._stored_events[i - 1]
                 if topics and s.topic not in topics:
                     continue
                 n = Notification(
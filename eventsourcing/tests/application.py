@@ -3,10 +3,9 @@ import sys
 import traceback
 import warnings
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
 from decimal import Decimal
 from threading import Event, get_ident
-from time import sleep
+from time import perf_counter, sleep
 from timeit import timeit
 from unittest import TestCase
 from uuid import UUID, uuid4
@@ -166,7 +165,7 @@ class ExampleApplicationTestCase(TestCase):
     def print_time(self, test_label, duration):
         cls = type(self)
         if cls not in self.started_ats:
-            self.started_ats[cls] = datetime.now()
+            self.started_ats[cls] = perf_counter()
             print(f"{cls.__name__: <29} timeit number: {cls.timeit_number}")
             self.counts[cls] = 1
         else:
@@ -181,8 +180,8 @@ class ExampleApplicationTestCase(TestCase):
         )
 
         if self.counts[cls] == 3:
-            duration = datetime.now() - cls.started_ats[cls]
-            print(f"{cls.__name__: <29} timeit duration: {duration}")
+            duration = perf_counter() - cls.started_ats[cls]
+            print(f"{cls.__name__: <29} timeit duration: {duration:.3f}s")
             sys.stdout.flush()
 
 
@@ -5,10 +5,9 @@ import traceback
 import zlib
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
 from tempfile import NamedTemporaryFile
 from threading import Event, Thread, get_ident
-from time import sleep
+from time import perf_counter, sleep
 from timeit import timeit
 from typing import Any, Dict, List, Optional
 from unittest import TestCase
@@ -420,7 +419,7 @@ class ApplicationRecorderTestCase(TestCase, ABC):
                 )
                 for i in range(num_events_per_write)
             ]
-            started = datetime.now()
+            started = perf_counter()
             # print(f"Thread {thread_num} write beginning #{count + 1}")
             try:
                 recorder.insert_events(stored_events)
@@ -428,13 +427,13 @@ class ApplicationRecorderTestCase(TestCase, ABC):
             except Exception as e:  # pragma: nocover
                 if errors:
                     return
-                ended = datetime.now()
-                duration = (ended - started).total_seconds()
+                ended = perf_counter()
+                duration = ended - started
                 print(f"Error after starting {duration}", e)
                 errors.append(e)
             else:
-                ended = datetime.now()
-                duration = (ended - started).total_seconds()
+                ended = perf_counter()
+                duration = ended - started
                 counts[thread_id] += 1
                 if duration > durations[thread_id]:
                     durations[thread_id] = duration
@@ -499,7 +498,7 @@ class ApplicationRecorderTestCase(TestCase, ABC):
         # Match this to the batch page size in postgres insert for max throughput.
         NUM_EVENTS = 500
 
-        started = datetime.now()
+        started = perf_counter()
 
         def insert_events() -> None:
             thread_id = get_ident()
@@ -529,8 +528,8 @@ class ApplicationRecorderTestCase(TestCase, ABC):
                 tb = traceback.format_exc()
                 print(tb)
             finally:
-                ended = datetime.now()
-                duration = (ended - started).total_seconds()
+                ended = perf_counter()
+                duration = ended - started
                 counts[thread_id] += 1
                 durations[thread_id] = duration
 
@@ -546,8 +545,8 @@ class ApplicationRecorderTestCase(TestCase, ABC):
                 future.result()
 
         self.assertFalse(errors_happened.is_set(), "There were errors (see above)")
-        ended = datetime.now()
-        rate = NUM_JOBS * NUM_EVENTS / (ended - started).total_seconds()
+        ended = perf_counter()
+        rate = NUM_JOBS * NUM_EVENTS / (ended - started)
         print(f"Rate: {rate:.0f} inserts per second")
 
     def close_db_connection(self, *args: Any) -> None:
@@ -342,7 +342,7 @@ class TestConnectionPool(TestCase):
         self.assertEqual(pool.num_in_pool, 0)
         self.assertFalse(conn2.closed)
         self.assertFalse(conn2.closing)
-        self.assertNotEqual(id(conn1), id(conn2))
+        self.assertIsNot(conn1, conn2)
         self.assertEqual(pool.num_in_pool, 0)
 
         # Timer fires before conn returned to pool.
@@ -359,7 +359,7 @@ class TestConnectionPool(TestCase):
         conn3 = pool.get_connection()
         self.assertFalse(conn3.closed)
         self.assertFalse(conn3.closing)
-        self.assertNotEqual(id(conn2), id(conn3))
+        self.assertIsNot(conn2, conn3)
         pool.put_connection(conn3)
 
     def test_get_with_timeout(self):
@@ -59,8 +59,6 @@ class TestNonInterleavingPostgres(NonInterleavingNotificationIDsBaseCase):
         drop_postgres_table(self.datastore, "stored_events")
 
     def create_recorder(self) -> ApplicationRecorder:
-        self.uris = tmpfile_uris()
-        self.db_uri = next(self.uris)
         recorder = PostgresApplicationRecorder(self.datastore)
         recorder.create_table()
         return recorder
@@ -25,11 +25,7 @@ class TestPOPOApplicationRecorder(ApplicationRecorderTestCase):
     def create_recorder(self):
         return POPOApplicationRecorder()
 
-    def test_insert_select(self) -> None:
-        super().test_insert_select()
-
-        # Check select_notifications() does not use negative indexes.
-
+    def test_select_notifications_does_not_use_negative_indexes(self) -> None:
         # Construct the recorder.
         recorder = self.create_recorder()
 
@@ -54,14 +50,36 @@ class TestPOPOApplicationRecorder(ApplicationRecorderTestCase):
         # This was returning 4.
         self.assertEqual(len(recorder.select_notifications(-1, 10)), 2)
 
+    def test_select_notifications_with_limit_less_than_one(self) -> None:
+        # Construct the recorder.
+        recorder = self.create_recorder()
+
+        # Write two stored events.
+        stored_event1 = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=self.INITIAL_VERSION,
+            topic="topic1",
+            state=b"state1",
+        )
+        stored_event2 = StoredEvent(
+            originator_id=uuid4(),
+            originator_version=self.INITIAL_VERSION,
+            topic="topic2",
+            state=b"state2",
+        )
+        recorder.insert_events([stored_event1, stored_event2])
+
+        # Check nothing is selected, with or without topics.
+        self.assertEqual(recorder.select_notifications(1, 0), [])
+        self.assertEqual(recorder.select_notifications(1, -1), [])
+        self.assertEqual(recorder.select_notifications(1, 0, topics=["topic1"]), [])
+        self.assertEqual(recorder.select_notifications(1, -1, topics=["topic1"]), [])
+
 
 class TestPOPOProcessRecorder(ProcessRecorderTestCase):
     def create_recorder(self):
         return POPOProcessRecorder()
 
-    def test_performance(self):
-        super().test_performance()
-
     def test_max_doesnt_increase_when_lower_inserted_later(self) -> None:
         # Construct the recorder.
         recorder = self.create_recorder()
@@ -1,5 +1,6 @@
 from threading import Event, Thread
 from time import sleep
+from typing import List
 from unittest import TestCase
 from unittest.mock import MagicMock, Mock
 from uuid import uuid4
@@ -42,8 +43,8 @@ from eventsourcing.tests.persistence_tests.test_connection_pool import (
     TestConnectionPool,
 )
 from eventsourcing.tests.postgres_utils import (
-    drop_postgres_table,
-    pg_close_all_connections,
+    drop_postgres_tables,
+    pg_close_connections,
 )
 from eventsourcing.utils import Environment
 
@@ -107,8 +108,7 @@ class TestPostgresConnectionPool(TestConnectionPool):
         )
 
     def close_connection_on_server(self, *connections):
-        # Close all connections.
-        pg_close_all_connections()
+        pg_close_connections(*connections)
 
     def test_get_connection(self):
         # Check we can get a postgres connection.
@@ -355,8 +355,8 @@ class TestPostgresDatastore(TestCase):
                     curs.execute("SELECT 1")
                     self.assertEqual(curs.fetchall(), [[1]])
 
-            # Close all connections via separate connection.
-            pg_close_all_connections()
+            # Close the pooled connection via separate connection.
+            pg_close_connections(*datastore.pool._pool)
 
             # Check the connection doesn't think it's closed.
             self.assertTrue(datastore.pool._pool)
@@ -389,7 +389,7 @@ class TestPostgresDatastore(TestCase):
             with datastore.transaction(commit=False) as curs:
                 curs.execute("SELECT 1")
                 self.assertFalse(curs.closed)
-                sleep(2)
+                sleep(1.5)
 
     def test_report_on_prepared_statements(self):
         datastore = PostgresDatastore(
@@ -430,10 +430,14 @@ class SetupPostgresDatastore(TestCase):
         self.drop_tables()
 
     def drop_tables(self):
+        # Drop all the tables in one statement, to avoid a round trip per table.
+        drop_postgres_tables(self.datastore, *self.table_names())
+
+    def table_names(self) -> List[str]:
         events_table_name = EVENTS_TABLE_NAME
         if self.datastore.schema:
             events_table_name = f"{self.datastore.schema}.{events_table_name}"
-        drop_postgres_table(self.datastore, events_table_name)
+        return [events_table_name]
 
 
 class WithSchema(SetupPostgresDatastore):
@@ -455,9 +459,8 @@ class TestPostgresAggregateRecorder(SetupPostgresDatastore, AggregateRecorderTes
         recorder.create_table()
         return recorder
 
-    def drop_tables(self):
-        super().drop_tables()
-        drop_postgres_table(self.datastore, "stored_events")
+    def table_names(self) -> List[str]:
+        return super().table_names() + ["stored_events"]
 
     def test_get_statement_name_alias(self):
         # A statement name that is not too long is aliased to the same.
@@ -535,7 +538,7 @@ class TestPostgresAggregateRecorder(SetupPostgresDatastore, AggregateRecorderTes
         self.assertTrue(self.datastore.pool._pool)
 
         # Close connections.
-        pg_close_all_connections()
+        pg_close_connections(*self.datastore.pool._pool)
         self.assertFalse(self.datastore.pool._pool[0].closed)
 
         # Write a stored event.
@@ -599,7 +602,7 @@ class TestPostgresAggregateRecorder(SetupPostgresDatastore, AggregateRecorderTes
         recorder.insert_events([stored_event1])
 
         # Close connections.
-        pg_close_all_connections()
+        pg_close_connections(*self.datastore.pool._pool)
         self.assertFalse(self.datastore.pool._pool[0].closed)
 
         # Select events.
@@ -789,7 +792,7 @@ class TestPostgresApplicationRecorder(
         recorder.insert_events([stored_event1])
 
         # Close connections.
-        pg_close_all_connections()
+        pg_close_connections(*self.datastore.pool._pool)
         self.assertFalse(self.datastore.pool._pool[0].closed)
 
         # Select events.
@@ -847,7 +850,7 @@ class TestPostgresApplicationRecorder(
         recorder.insert_events([stored_event1])
 
         # Close connections.
-        pg_close_all_connections()
+        pg_close_connections(*self.datastore.pool._pool)
         self.assertFalse(self.datastore.pool._pool[0].closed)
 
         # Get max notification ID.
@@ -1034,12 +1037,11 @@ assert len(TRACKING_TABLE_NAME) == 63
 
 
 class TestPostgresProcessRecorder(SetupPostgresDatastore, ProcessRecorderTestCase):
-    def drop_tables(self):
-        super().drop_tables()
+    def table_names(self) -> List[str]:
         tracking_table_name = TRACKING_TABLE_NAME
         if self.datastore.schema:
             tracking_table_name = f"{self.datastore.schema}.{tracking_table_name}"
-        drop_postgres_table(self.datastore, tracking_table_name)
+        return super().table_names() + [tracking_table_name]
 
     def create_recorder(self):
         events_table_name = EVENTS_TABLE_NAME
@@ -1092,7 +1094,7 @@ class TestPostgresProcessRecorder(SetupPostgresDatastore, ProcessRecorderTestCas
         recorder.insert_events([stored_event1], tracking=Tracking("upstream", 1))
 
         # Close connections.
-        pg_close_all_connections()
+        pg_close_connections(*self.datastore.pool._pool)
         self.assertFalse(self.datastore.pool._pool[0].closed)
 
         # Get max tracking ID.
@@ -1139,9 +1141,8 @@ class TestPostgresProcessRecorderWitSchema(WithSchema, TestPostgresProcessRecord
 
 
 class TestPostgresProcessRecorderErrors(SetupPostgresDatastore, TestCase):
-    def drop_tables(self):
-        super().drop_tables()
-        drop_postgres_table(self.datastore, TRACKING_TABLE_NAME)
+    def table_names(self) -> List[str]:
+        return super().table_names() + [TRACKING_TABLE_NAME]
 
     def create_recorder(self):
         return PostgresProcessRecorder(
@@ -1175,6 +1176,24 @@ class TestPostgresInfrastructureFactory(InfrastructureFactoryTestCase):
     def expected_process_recorder_class(self):
         return PostgresProcessRecorder
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Share one datastore for dropping tables, rather than connecting
+        # afresh before and after each test.
+        cls.drop_tables_datastore = PostgresDatastore(
+            "eventsourcing",
+            "127.0.0.1",
+            "5432",
+            "eventsourcing",
+            "eventsourcing",
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.drop_tables_datastore.close()
+        super().tearDownClass()
+
     def setUp(self) -> None:
         self.env = Environment("TestCase")
         self.env[InfrastructureFactory.PERSISTENCE_MODULE] = Factory.__module__
@@ -1191,15 +1210,9 @@ class TestPostgresInfrastructureFactory(InfrastructureFactoryTestCase):
         super().tearDown()
 
     def drop_tables(self):
-        datastore = PostgresDatastore(
-            "eventsourcing",
-            "127.0.0.1",
-            "5432",
-            "eventsourcing",
-            "eventsourcing",
+        drop_postgres_tables(
+            self.drop_tables_datastore, "testcase_events", "testcase_tracking"
         )
-        drop_postgres_table(datastore, "testcase_events")
-        drop_postgres_table(datastore, "testcase_tracking")
 
     def test_conn_max_age_is_set_to_empty_string(self):
         self.env[Factory.POSTGRES_CONN_MAX_AGE] = ""
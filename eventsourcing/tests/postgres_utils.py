@@ -1,7 +1,7 @@
 import psycopg2
 
 from eventsourcing.persistence import PersistenceError
-from eventsourcing.postgres import PostgresDatastore
+from eventsourcing.postgres import PostgresConnection, PostgresDatastore
 
 
 def pg_close_all_connections(
@@ -11,9 +11,48 @@ def pg_close_all_connections(
     user="postgres",
     password="postgres",
 ):
+    pg_conn = _pg_admin_connect(name, host, port, user, password)
+    close_all_connections = """
+    SELECT
+        pg_terminate_backend(pid)
+    FROM
+        pg_stat_activity
+    WHERE
+        -- don't kill my own connection!
+        pid <> pg_backend_pid();
+
+    """
+    pg_conn_cursor = pg_conn.cursor()
+    pg_conn_cursor.execute(close_all_connections)
+    return close_all_connections, pg_conn_cursor
+
+
+def pg_close_connections(
+    *connections: PostgresConnection,
+    name="eventsourcing",
+    host="127.0.0.1",
+    port="5432",
+    user="postgres",
+    password="postgres",
+):
+    # Only terminate the given connections' server processes, so that
+    # connections that don't belong to the test are left alone.
+    pids = [c._pg_conn.get_backend_pid() for c in connections]
+    pg_conn = _pg_admin_connect(name, host, port, user, password)
+    try:
+        with pg_conn.cursor() as pg_conn_cursor:
+            pg_conn_cursor.execute(
+                "SELECT pg_terminate_backend(pid) FROM unnest(%s::int[]) AS pid;",
+                (pids,),
+            )
+    finally:
+        pg_conn.close()
+
+
+def _pg_admin_connect(name, host, port, user, password):
     try:
         # For local development... probably.
-        pg_conn = psycopg2.connect(
+        return psycopg2.connect(
             dbname=name,
             host=host,
             port=port,
@@ -21,26 +60,13 @@ def pg_close_all_connections(
     except psycopg2.Error:
         # For GitHub actions.
         """CREATE ROLE postgres LOGIN SUPERUSER PASSWORD 'postgres';"""
-        pg_conn = psycopg2.connect(
+        return psycopg2.connect(
             dbname=name,
             host=host,
             port=port,
             user=user,
             password=password,
         )
-    close_all_connections = """
-    SELECT
-        pg_terminate_backend(pid)
-    FROM
-        pg_stat_activity
-    WHERE
-        -- don't kill my own connection!
-        pid <> pg_backend_pid();
-
-    """
-    pg_conn_cursor = pg_conn.cursor()
-    pg_conn_cursor.execute(close_all_connections)
-    return close_all_connections, pg_conn_cursor
 
 
 def drop_postgres_table(datastore: PostgresDatastore, table_name):
@@ -50,3 +76,9 @@ def drop_postgres_table(datastore: PostgresDatastore, table_name):
             curs.execute(statement)
     except PersistenceError:
         pass
+
+
+def drop_postgres_tables(datastore: PostgresDatastore, *table_names):
+    statement = f"DROP TABLE IF EXISTS {', '.join(table_names)};"
+    with datastore.transaction(commit=True) as curs:
+        curs.execute(statement)
@@ -5,7 +5,7 @@ import eventsourcing
 from eventsourcing.domain import Aggregate
 from eventsourcing.utils import (
     TopicError,
-    clear_topic_cache,
+    _topic_cache,
     get_topic,
     register_topic,
     resolve_topic,
@@ -151,6 +151,11 @@ class TestStrtobool(TestCase):
 
 
 class TestTopics(TestCase):
+    def setUp(self) -> None:
+        # Remember which topics were cached before the test, so that only
+        # the topics registered by the test need to be removed afterwards.
+        self.cached_topics = set(_topic_cache)
+
     def test_get_topic(self):
         self.assertEqual("eventsourcing.domain:Aggregate", get_topic(Aggregate))
 
@@ -224,4 +229,5 @@ class TestTopics(TestCase):
         self.assertIn("is already registered for topic 'old'", cm.exception.args[0])
 
     def tearDown(self) -> None:
-        clear_topic_cache()
+        for topic in set(_topic_cache) - self.cached_topics:
+            _topic_cache.pop(topic, None)